@@ -34,9 +34,10 @@ from PCF8574TonHD44780 import PCF8574TonHD44780
 
 sda = machine.Pin(0)
 scl = machine.Pin(1)
-i2c = machine.I2C(0, sda=sda, scl=scl, freq=400000)
+i2c_freq = 400000
+i2c = machine.I2C(0, sda=sda, scl=scl, freq=i2c_freq)
 
-lcd = PCF8574TonHD44780(i2c, 0x27, True)
+lcd = PCF8574TonHD44780(i2c, 0x27, True, i2c_freq)
 lcd.initialize_lcd()
 
 lcd.display_off()
@@ -0,0 +1,55 @@
+# BSD 3-Clause License
+# 
+# Copyright (c) 2025, Derek Will
+# All rights reserved.
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+# 
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+"""This file defines the native code nibble encoder used for burst writes to the HD44780 Data Register.
+Kept in its own module so that ports without the viper code emitter can fall back to pure Python.
+"""
+
+import micropython
+
+_E = const(0x04) # clock enable: set for on
+
+@micropython.viper
+def encode_run(dst: ptr8, src: ptr8, n: int, req: int):
+    """Encodes n character codes from src into dst as 4-bit mode I2C-bytes (5 per character).
+    req holds the RS, RW, and BL bits that are set in every I2C-byte.
+    Each character starts with a clock enable low byte to provide the address setup time, see write_4bit.
+    """
+    for i in range(n):
+        c = int(src[i])
+        upper_nibble = (c & 0xf0) | req
+        lower_nibble = ((c & 0x0f) << 4) | req
+        k = (i << 2) + i
+        dst[k] = upper_nibble
+        dst[k + 1] = upper_nibble | _E
+        dst[k + 2] = upper_nibble
+        dst[k + 3] = lower_nibble | _E
+        dst[k + 4] = lower_nibble
@@ -31,6 +31,39 @@
 import utime
 import HD44780Constants
 
+try:
+    from PCF8574TNibbleEncoder import encode_run as _encode_run
+# SyntaxError is raised by ports without the viper code emitter,
+# ValueError by a .mpy built for a different architecture (incompatible .mpy arch).
+except (ImportError, SyntaxError, ValueError):
+    _encode_run = None
+
+# Declared at module scope so that MicroPython inlines them into the bytecode at compile time.
+_RS = const(0x01) # register select: set for data register
+_RW = const(0x02) # read/write mode: set for read mode
+_E = const(0x04) # clock enable: set for on
+_BL = const(0x08) # backlight: set for on
+
+_DB_HIGH = const(0xf0) # DB4-DB7 in high state
+
+# Set for 2-line display
+_NUM_COLUMNS = const(40)
+_NUM_ROWS = const(2)
+
+# Execution times depend only on the HD44780 oscillator frequency, not on the I2C bus frequency.
+_LONG_DELAY_US = const(2160) # 1520 us when frequency is 270 kHz, 2160 us when frequency is 190 kHz (worst-case)
+_SHORT_DELAY_US = const(52) # 37 us when frequency is 270 kHz, 52 us when frequency is 190 kHz (worst-case)
+
+# Minimum time on the wire between the clock enable fall that completes a data write and the next clock enable
+# edge that transfers data: the falling edge for a write (a write nibble is only clocked in on the falling edge,
+# so the rising edge before it does not count) or the rising edge for a read (data is driven while enable is high).
+# Each I2C byte takes 9 bit periods (8 data bits + ACK) on the wire, giving these gaps:
+#   burst, next character:         3 bytes (byte 5k+4 to byte 5k+7)       = 27 bit periods
+#   next transaction is a read:    address byte + 2 bytes to enable high  = 27 bit periods
+#   next transaction is a write:   address byte + 3 bytes to enable low   = 36 bit periods
+_MIN_GAP_BITS = const(27)
+
+
 class PCF8574TonHD44780:
     """
     PCF8574T GPIO extender interface for commanding/controlling a HD44780 LCD over I2C.
@@ -53,132 +86,149 @@ class PCF8574TonHD44780:
     I2C-byte: DB7 DB6 DB5 DB4 BL E RW RS     
     """
     
-    _RS = const(0x01) # register select: set for data register
-    _RW = const(0x02) # read/write mode: set for read mode
-    _E = const(0x04) # clock enable: set for on
-    _BL = const(0x08) # backlight: set for on
-    
-    _DB_HIGH = const(0xf0) # DB4-DB7 in high state
-    
-    # Set for 2-line display
-    _NUM_COLUMNS = const(40)
-    _NUM_ROWS = const(2)
-    
-    _LONG_DELAY_US = const(2160) # 1520 us when frequency is 270 kHz, 2160 us when frequency is 190 kHz (worst-case)
-    _SHORT_DELAY_US = const(52) # 37 us when frequency is 270 kHz, 52 us when frequency is 190 kHz (worst-case)
-        
-    def __init__(self, i2c, i2c_addr, check_busy_flag):
+    def __init__(self, i2c, i2c_addr, check_busy_flag, i2c_freq=None):
         self.i2c = i2c
         self.addr = i2c_addr
+        # machine.I2C does not report its configured frequency, so the caller passes it in (in Hz).
+        # When _MIN_GAP_BITS on the wire take at least as long as a data write takes to execute, the execution
+        # delay of data writes is hidden by whatever is sent next, and data can be sent in bursts.
+        # If the frequency is unknown, the execution delays are kept.
+        if i2c_freq is None:
+            self._wire_covers_delay = False
+        else:
+            self._wire_covers_delay = _MIN_GAP_BITS * 1000000 // i2c_freq >= _SHORT_DELAY_US
         self.backlight_enable = True
+        self._update_base()
         self.cursor_pos_x = 0
         self.cursor_pos_y = 0
+        self._pending_ac_move = False # set when the address counter no longer matches the tracked cursor position
+        self._ac_increment = True # address counter increments after each DDRAM access, see set_entry_mode
+        self._dr_stale = False # set after a CG/DDRAM write, until the next address set makes reads valid again
         self.initialized = False
         self.check_busy_flag = check_busy_flag
+        self._buf = bytearray(5) # scratch buffer for write_4bit, reused to avoid per-call allocations
+        self._rbuf = bytearray(1) # scratch buffers for read_4bit, reused to avoid per-call allocations
+        self._pbuf = bytearray(2)
+        self._pbuf_end = bytearray(1)
+        self._last_write_us = 0 # ticks_us timestamp of the last instruction with a deferred execution delay
+        self._pending_delay_us = 0 # execution delay still owed to the last instruction
 
     def write_init(self, value):
         """Write Initialization Data.
         Only DB7, DB6, DB5, DB4 are used.
         """
-        upper_nibble = value & 0xf0
-        
         # RS, RW Setup (Address Setup Time): RW, RS pins must be settled before setting clock enable high.
-        self.i2c.writeto(self.addr, bytes([upper_nibble]))
-        utime.sleep_us(1) # minimum address setup time is 60 ns
-        
         # The clock of the HD44780 is a falling edge-triggered clock.
         # This means it will execute new instructions on the falling edge of the clock signal.
         # Therefore we send the nibble twice to properly pulse the clock enable pin.
-        # First with clock enable set high, then with clock enable set low.   
-        self.i2c.writeto(self.addr, bytes([upper_nibble | _E]))
-        utime.sleep_us(1) # minimum enable pulse width time is 450 ns
-        self.i2c.writeto(self.addr, bytes([upper_nibble]))
-        # enable fall time is worst-case 25 ns, plus address hold time of at least 20 ns
-        # Address hold time: RW, RS pins must be settled after setting clock enable low
-        utime.sleep_us(1)
+        # First with clock enable set high, then with clock enable set low.
+        # The PCF8574 latches each byte on the I2C ACK, so sending the three states in a single
+        # transaction satisfies the setup (60 ns), enable pulse width (450 ns) and address hold (20 ns)
+        # times with plenty of margin: each byte takes 9 bit periods (22.5 us at 400 kHz) on the wire.
+        self.i2c.writeto(self.addr, self._init_payload(value))
+
+    def _init_payload(self, value):
+        """Builds the single I2C transaction used by write_init (setup, clock enable high, clock enable low)."""
+        upper_nibble = value & 0xf0
+        return bytes((upper_nibble, upper_nibble | _E, upper_nibble))
 
     def write_4bit(self, value, write_dr):
         """Write value to Instruction Register (IR) when False or Data Register (DR) when True in 4-bit interface mode."""
         if not self.initialized:
             raise RuntimeError("Initialization function has not been called yet!")
         
-        req = (_RS if write_dr else 0) | (_BL if self.backlight_enable else 0)
-        
-        # RS, RW Setup (Address Setup Time): RW, RS pins must be settled before setting clock enable high.
-        self.i2c.writeto(self.addr, bytes([req]))
-        utime.sleep_us(1) # minimum address setup time is 60 ns
+        self._wait_pending_delay()
         
-        # We send each nibble twice to properly pulse the clock enable pin. See write_init function for more details.    
-        upper_nibble = (value & 0xf0) | req
-        self.i2c.writeto(self.addr, bytes([upper_nibble | _E]))
-        utime.sleep_us(1) # minimum enable pulse width time is 450 ns
-        self.i2c.writeto(self.addr, bytes([upper_nibble]))
-        # enable fall time is worst-case 25 ns, plus address hold time of at least 20 ns
-        # Address hold time: RW, RS pins must be settled after setting clock enable low
-        utime.sleep_us(1)
-        
-        lower_nibble = ((value & 0x0f) << 4) | req
-        self.i2c.writeto(self.addr, bytes([lower_nibble | _E]))
-        utime.sleep_us(1) # minimum enable pulse width time is 450 ns
-        self.i2c.writeto(self.addr, bytes([lower_nibble]))
-        # enable fall time is worst-case 25 ns, plus address hold time of at least 20 ns
-        # Address hold time: RW, RS pins must be settled after setting clock enable low
-        utime.sleep_us(1)
+        # We send each nibble twice to properly pulse the clock enable pin. See write_init function for more details.
+        # All five states are sent in a single I2C transaction. The first byte is the upper nibble with clock
+        # enable low, which provides the RS, RW Setup (Address Setup Time): RW, RS pins must be settled before
+        # setting clock enable high. This matters whenever the previous access targeted the other register
+        # or was a read. The PCF8574 latches each byte on the I2C ACK, so the setup time (60 ns), enable pulse
+        # width (450 ns) and address hold time (20 ns) are covered by the byte time on the wire.
+        buf = self._buf
+        if write_dr:
+            # Data writes are the hot path of write_str, so look the nibbles up instead of assembling them.
+            # Masked like the instruction path, so values above 0xff keep their low byte as before.
+            upper_nibble = (value >> 4) & 0x0f
+            lower_nibble = value & 0x0f
+            buf[0] = self._dr_nib[upper_nibble]
+            buf[1] = self._dr_nib_e[upper_nibble]
+            buf[2] = self._dr_nib[upper_nibble]
+            buf[3] = self._dr_nib_e[lower_nibble]
+            buf[4] = self._dr_nib[lower_nibble]
+        else:
+            req = self._base_ir
+            upper_nibble = (value & 0xf0) | req
+            lower_nibble = ((value & 0x0f) << 4) | req
+            buf[0] = upper_nibble
+            buf[1] = upper_nibble | _E
+            buf[2] = upper_nibble
+            buf[3] = lower_nibble | _E
+            buf[4] = lower_nibble
+        # writeto transmits synchronously, so the buffer can be reused as soon as it returns.
+        self.i2c.writeto(self.addr, buf)
         
         # instruction execution time delay
         if write_dr:
-            self.execution_delay(_SHORT_DELAY_US)
+            # A data write completes before the next clock enable edge that transfers data (see _MIN_GAP_BITS),
+            # unless the I2C bus is fast enough to outrun the HD44780 or its frequency is unknown.
+            if not self._wire_covers_delay:
+                self._defer_delay(_SHORT_DELAY_US)
+        elif value <= 0x03:
+            # Clear display (0x01) and return home (0x02-0x03, DB0 is don't care) are the only instructions
+            # in this range. Comparing against a literal avoids two module attribute lookups on every write.
+            # They take longer than any plausible wire time, so always block.
+            self.execution_delay(_LONG_DELAY_US)
         else:
-            if value == HD44780Constants.CLEAR_DISPLAY or value == HD44780Constants.RETURN_HOME:
-                self.execution_delay(_LONG_DELAY_US)
-            else:
-                self.execution_delay(_SHORT_DELAY_US)
+            self._defer_delay(_SHORT_DELAY_US)
 
     def read_4bit(self, read_dr):
         """Read value from Instruction Register (IR) when False or Data Register (DR) when True in 4-bit interface mode."""
         if not self.initialized:
             raise RuntimeError("Initialization function has not been called yet!")
         
-        req = _RW | (_RS if read_dr else 0) | (_BL if self.backlight_enable else 0)
+        # Reading the busy flag and address counter is allowed while an instruction is executing.
+        if read_dr:
+            self._wait_pending_delay()
+        
+        req = _RW | (self._base_dr if read_dr else self._base_ir)
+        self._pbuf_end[0] = req
         
+        # The first byte of each pulse transaction sets clock enable low. For the first pulse this provides the
         # RS, RW Setup (Address Setup Time): RW, RS pins must be settled before setting clock enable high.
-        self.i2c.writeto(self.addr, bytes([req]))
-        utime.sleep_us(1) # minimum address setup time is 60 ns
-        
-        # Set clock enable high and set Data Bits 4-7 high.
+        # For the second pulse it completes the previous enable pulse, so no separate writes are needed.
+        # The second byte sets clock enable high and sets Data Bits 4-7 high.
         # Setting DB4-DB7 high is necessary in order to set P4-P7 high on the PCF8574.
         # In order to read a value from P4-P7, they must be set to high.
         # We set clock enable high to begin enable pulse. See write_init function for more details.
-        self.i2c.writeto(self.addr, bytes([req | _E | _DB_HIGH ]))
-        utime.sleep_us(1) # minimum enable pulse width time is 450 ns
+        pulse = self._pbuf
+        pulse[0] = req
+        pulse[1] = req | _E | _DB_HIGH
+        # minimum enable pulse width time is 450 ns, covered by the START and address byte of the following read
+        self.i2c.writeto(self.addr, pulse)
         
         # Read upper nibble while clock enable is set high and Data Bits are set high.
-        i2c_data = self.i2c.readfrom(self.addr, 1)      
-        data = i2c_data[0] & 0xf0
-        
-        # Set clock enable low to complete enable pulse and also set Data Bits 4-7 low.
-        self.i2c.writeto(self.addr, bytes([req]))
-        # enable fall time is worst-case 25 ns, plus address hold time of at least 20 ns
-        # Address hold time: RW, RS pins must be settled after setting clock enable low
-        utime.sleep_us(1)
+        self.i2c.readfrom_into(self.addr, self._rbuf)
+        data = self._rbuf[0] & 0xf0
         
-        # Set clock enable high to begin enable pulse and set Data Bits 4-7 high. See above for rationale.
-        self.i2c.writeto(self.addr, bytes([req | _E | _DB_HIGH ]))
-        utime.sleep_us(1) # minimum enable pulse width time is 450 ns
+        # Set clock enable low to complete enable pulse and also set Data Bits 4-7 low, then begin the next pulse.
+        # enable fall time is worst-case 25 ns, plus address hold time of at least 20 ns, covered by the byte time.
+        # minimum enable pulse width time is 450 ns, covered by the START and address byte of the following read
+        self.i2c.writeto(self.addr, pulse)
         
         # Read lower nibble while clock enable is set high and Data Bits are set high.
-        i2c_data = self.i2c.readfrom(self.addr, 1)        
-        data |= (i2c_data[0] >> 4)
+        self.i2c.readfrom_into(self.addr, self._rbuf)
+        data |= (self._rbuf[0] >> 4)
         
         # Set clock enable low to complete enable pulse and also set Data Bits 4-7 low.
-        self.i2c.writeto(self.addr, bytes([req]))
+        self.i2c.writeto(self.addr, self._pbuf_end)
         # enable fall time is worst-case 25 ns, plus address hold time of at least 20 ns
         # Address hold time: RW, RS pins must be settled after setting clock enable low
-        utime.sleep_us(1)
+        # Both are covered by the STOP condition and the start of any following transaction.
         
         # instruction execution time delay
         if read_dr:
-            self.execution_delay(_SHORT_DELAY_US)
+            self._defer_delay(_SHORT_DELAY_US)
 
         return data
 
@@ -186,12 +236,15 @@ class PCF8574TonHD44780:
         """Initialize the LCD using the 4-bit mode initialization sequence.
         Additionally, configures the display for 2-lines and 5x8 font.
         """
+        # Each reset is a single I2C transaction (see write_init), built once and sent three times.
+        # The waits in between are HD44780 requirements, so the resets cannot be merged into one transaction.
+        reset_payload = self._init_payload(HD44780Constants.RESET_CMD)
         utime.sleep_ms(100) # wait for more than 40 ms after Vcc rises to 2.7V
-        self.write_init(HD44780Constants.RESET_CMD) 
+        self.i2c.writeto(self.addr, reset_payload)
         utime.sleep_ms(5) # wait for more than 4.1 ms
-        self.write_init(HD44780Constants.RESET_CMD) 
+        self.i2c.writeto(self.addr, reset_payload)
         utime.sleep_ms(1) # wait for more than 100 us
-        self.write_init(HD44780Constants.RESET_CMD)
+        self.i2c.writeto(self.addr, reset_payload)
         utime.sleep_ms(1) # wait for more than 100 us 
         
         # Now set to 4-bit mode
@@ -206,6 +259,7 @@ class PCF8574TonHD44780:
         """Returns cursor position to the left edge of the first line"""
         self.cursor_pos_x = 0
         self.cursor_pos_y = 0
+        self._pending_ac_move = False
         self.write_4bit(HD44780Constants.RETURN_HOME, False)
     
     def display_off(self):
@@ -220,6 +274,7 @@ class PCF8574TonHD44780:
         """Clears display"""
         self.cursor_pos_x = 0
         self.cursor_pos_y = 0
+        self._pending_ac_move = False
         self.write_4bit(HD44780Constants.CLEAR_DISPLAY, False)
 
     def cursor_on(self, blink):
@@ -244,16 +299,29 @@ class PCF8574TonHD44780:
             value |= HD44780Constants.ENTRY_MODE_SHIFT
             
         self.write_4bit(value, False)
+        # The tracked cursor position only follows the address counter when it increments.
+        self._ac_increment = increment
         
     def backlight_on(self):
         """Turns on backlight"""
         self.backlight_enable = True
+        self._update_base()
         self.i2c.writeto(self.addr, bytes([_BL]))
         
     def backlight_off(self):
         """Turns off backlight"""
         self.backlight_enable = False
+        self._update_base()
         self.i2c.writeto(self.addr, bytes([0]))
+
+    def _update_base(self):
+        """Recomputes the cached I2C-bytes that depend on the backlight state."""
+        self._base_ir = _BL if self.backlight_enable else 0 # I2C-byte base (RS, BL) for instruction register access
+        self._base_dr = _RS | self._base_ir # I2C-byte base (RS, BL) for data register access
+        # I2C-bytes for writing each nibble value to the data register, with clock enable low and high
+        self._dr_nib = bytes((nibble << 4) | self._base_dr for nibble in range(16))
+        self._dr_nib_e = bytes((nibble << 4) | self._base_dr | _E for nibble in range(16))
+        self._char_lut = None # per-character I2C payloads for data writes, built on first use by _write_dr_burst
     
     def set_cursor_pos(self, x, y):
         """Set cursor position (0-based index)"""
@@ -270,29 +338,146 @@ class PCF8574TonHD44780:
             ddram_addr += 0x40
         
         self.write_4bit(HD44780Constants.DDRAM_SET | ddram_addr, False)
+        self._pending_ac_move = False
+        self._dr_stale = False
+
+    def _flush_cursor_pos(self):
+        """Moves the cursor to the tracked position if the address counter no longer matches it."""
+        if self._pending_ac_move:
+            self.set_cursor_pos(self.cursor_pos_x, self.cursor_pos_y)
         
     def write_char(self, char):
         """Writes a single character to the display"""
-        if char == '\n':
+        self._write_char_code(ord(char))
+
+    def _write_char_code(self, value):
+        """Writes a single character code to the display, treating 0x0a as a newline"""
+        if value == 0x0a:
             self.cursor_pos_x = _NUM_COLUMNS
+            # The address counter does not move on a newline, so move the cursor before the next write.
+            self._pending_ac_move = True
         else:
-            self.write_4bit(ord(char), True)
+            self._flush_cursor_pos()
+            self.write_4bit(value, True)
+            self._dr_stale = True
             self.cursor_pos_x += 1
+            # In decrement mode the address counter moves the other way, so move it explicitly before the next write.
+            if not self._ac_increment:
+                self._pending_ac_move = True
         
+        # In increment mode the address counter auto-increments after each data write and wraps from the end
+        # of one line to the start of the other (0x27 -> 0x40, 0x67 -> 0x00), so it keeps matching the tracked position.
         if self.cursor_pos_x >= _NUM_COLUMNS:
             self.cursor_pos_x = 0
             self.cursor_pos_y += 1
             
         if self.cursor_pos_y >= _NUM_ROWS:
             self.cursor_pos_y = 0
-            
-        self.set_cursor_pos(self.cursor_pos_x, self.cursor_pos_y)
         
     def write_str(self, string):
         """Write a string of characters to the display"""
-        for char in string:
-            self.write_char(char)
-            
+        # Iterating over the character codes avoids allocating a one-character string per character.
+        for value in self._to_char_codes(string):
+            self._write_char_code(value)
+
+    def write_str_fast(self, string):
+        """Write a string of characters to the display.
+        Each run of characters that fits on the current line is sent as a single I2C transaction.
+        The instruction execution time of each character is covered by the time it takes to send
+        the start of the next character over the I2C bus, so no execution delay is inserted within a run.
+        On buses too fast for that, characters are written one at a time (see _write_dr_burst).
+        """
+        if not self.initialized:
+            raise RuntimeError("Initialization function has not been called yet!")
+
+        # Bursts rely on the address counter incrementing, so decrement mode positions each character explicitly.
+        if not self._ac_increment:
+            self.write_str(string)
+            return
+
+        data = self._to_char_codes(string)
+        start = 0
+        while start < len(data):
+            end = min(len(data), start + _NUM_COLUMNS - self.cursor_pos_x)
+            newline = data.find(b'\n', start, end)
+            if newline >= 0:
+                end = newline
+
+            if end > start:
+                self._flush_cursor_pos()
+                self._write_dr_burst(data[start:end])
+                self.cursor_pos_x += end - start
+
+            if newline >= 0:
+                self.cursor_pos_x = _NUM_COLUMNS
+                self._pending_ac_move = True # see _write_char_code
+                end += 1
+            start = end
+
+            if self.cursor_pos_x >= _NUM_COLUMNS:
+                self.cursor_pos_x = 0
+                self.cursor_pos_y += 1
+                if self.cursor_pos_y >= _NUM_ROWS:
+                    self.cursor_pos_y = 0
+
+    def _write_dr_burst(self, data):
+        """Writes a bytes object of values to the Data Register (DR) in a single I2C transaction.
+        Each value is sent as the same five states that write_4bit uses, including the leading clock enable low byte.
+        The execution time of each data write is covered by the 3 bytes sent before the next value's upper nibble
+        is clocked in (see _MIN_GAP_BITS). On faster buses where that does not hold, the values are written
+        one at a time instead.
+        """
+        self._dr_stale = True
+        if not self._wire_covers_delay:
+            for value in data:
+                self.write_4bit(value, True)
+            return
+
+        self._wait_pending_delay()
+
+        if _encode_run is not None:
+            # Encode with native code when the viper code emitter is available.
+            buf = bytearray(5 * len(data))
+            _encode_run(buf, data, len(data), self._base_dr)
+            self.i2c.writeto(self.addr, buf)
+            return
+
+        lut = self._char_lut
+        if lut is None:
+            # Trades RAM for no per-character arithmetic: a contiguous 1280-byte table (5 bytes per character
+            # code) plus 256 precomputed memoryview slices into it and the list holding them.
+            # Rebuilt when the backlight state changes.
+            nib = self._dr_nib
+            nib_e = self._dr_nib_e
+            table = bytearray(1280)
+            for value in range(256):
+                k = 5 * value
+                table[k] = nib[value >> 4]
+                table[k + 1] = nib_e[value >> 4]
+                table[k + 2] = nib[value >> 4]
+                table[k + 3] = nib_e[value & 0x0f]
+                table[k + 4] = nib[value & 0x0f]
+            view = memoryview(table)
+            lut = [view[5 * value:5 * value + 5] for value in range(256)]
+            self._char_lut = lut
+
+        # writevto sends all of the buffers in a single I2C transaction. The only allocation per burst is the list.
+        self.i2c.writevto(self.addr, [lut[value] for value in data])
+
+    def _to_char_codes(self, string):
+        """Converts a string to the character codes sent to the display.
+        MicroPython always encodes str as UTF-8, which only matches the character codes for ASCII,
+        so strings containing characters above 0x7f are converted one character at a time.
+        """
+        if isinstance(string, (bytes, bytearray)):
+            return bytes(string)
+        if not isinstance(string, str):
+            raise TypeError("String is expected to be a str, bytes or bytearray")
+        data = string.encode()
+        if len(data) != len(string):
+            data = bytes(ord(char) for char in string)
+        return data
+
     def shift_display(self, shift_right):
         """Shifts the display by one unit to either the left or the right"""
         value = HD44780Constants.SHIFT | HD44780Constants.SHIFT_DISPLAY
@@ -312,8 +497,8 @@ class PCF8574TonHD44780:
         
         cgram_addr = index << 3
         self.write_4bit(HD44780Constants.CGRAM_SET | cgram_addr, False)
-        for i in range(8):
-            self.write_4bit(char_pattern[i], True)
+        # The address counter auto-increments after each data write, so the whole pattern is sent in one burst.
+        self._write_dr_burst(bytes(char_pattern))
             
         self.set_cursor_pos(self.cursor_pos_x, self.cursor_pos_y)
     
@@ -324,23 +509,64 @@ class PCF8574TonHD44780:
         """
         return self.read_4bit(False)
     
-    def read_data_register(self):
-        """Reads data from the Data Register (DR)."""
+    def read_data_register(self, restore=False):
+        """Reads data from the Data Register (DR).
+        The tracked cursor position advances after each read, like the address counter does in increment mode.
+        If restore is set, the cursor is moved back to the position it was at before the read
+        (deferred until the next DDRAM access).
+        """
+        # After a CG/DDRAM write the correct data is not read out until an address set, so one is sent
+        # whenever a write happened since the last one, not only when the address counter is out of sync.
+        if self._pending_ac_move or self._dr_stale:
+            self.set_cursor_pos(self.cursor_pos_x, self.cursor_pos_y)
         data = self.read_4bit(True)
-        self.set_cursor_pos(self.cursor_pos_x, self.cursor_pos_y)
+        if restore:
+            self._pending_ac_move = True
+        else:
+            self.cursor_pos_x += 1
+            if self.cursor_pos_x >= _NUM_COLUMNS:
+                self.cursor_pos_x = 0
+                self.cursor_pos_y += 1
+            if self.cursor_pos_y >= _NUM_ROWS:
+                self.cursor_pos_y = 0
+            # In decrement mode the address counter moved the other way, so move it to the tracked position.
+            if not self._ac_increment:
+                self._pending_ac_move = True
         return data
 
     def execution_delay(self, delay_usecs):
         """Instruction execution delay
-        If check_busy_flag is set, then poll busy flag by reading from instruction register.
+        If check_busy_flag is set and the delay is a long one (clear display / return home), then check the
+        busy flag by reading from instruction register and sleep for the remainder of the delay if it is still set.
         Otherwise, just delay (sleep) for the specified microseconds.
+        Reading the busy flag takes several I2C transactions, which is slower than simply sleeping through a short delay.
         """
-        if self.check_busy_flag:
-            start_ticks = utime.ticks_us()
-            while self.read_instruction_register() >> 7:
-                if utime.ticks_diff(utime.ticks_us(), start_ticks) >= delay_usecs:
-                    print("Warning: Busy flag did not clear in time...")
-                    break   
-        else:
+        if delay_usecs < _LONG_DELAY_US or not self.check_busy_flag:
             utime.sleep_us(delay_usecs)
-        
\ No newline at end of file
+            return
+
+        start_ticks = utime.ticks_us()
+        if not self.read_instruction_register() >> 7:
+            return
+
+        # Each poll takes about as long as the instruction itself, so sleep for the rest of the delay instead.
+        remaining = delay_usecs - utime.ticks_diff(utime.ticks_us(), start_ticks)
+        if remaining > 0:
+            utime.sleep_us(remaining)
+        if self.read_instruction_register() >> 7:
+            print("Warning: Busy flag did not clear in time...")
+
+    def _defer_delay(self, delay_usecs):
+        """Defers the instruction execution delay until the next access to the LCD.
+        Time spent in between (e.g. sending the next transaction over the I2C bus) counts towards the delay.
+        """
+        self._last_write_us = utime.ticks_us()
+        self._pending_delay_us = delay_usecs
+
+    def _wait_pending_delay(self):
+        """Waits for whatever remains of a deferred instruction execution delay."""
+        if self._pending_delay_us:
+            remaining = self._pending_delay_us - utime.ticks_diff(utime.ticks_us(), self._last_write_us)
+            self._pending_delay_us = 0
+            if remaining > 0:
+                self.execution_delay(remaining)